@@ -1,12 +1,164 @@
+import io
 import os
+import re
 import logging
+import multiprocessing
+import tempfile
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import pydicom
 import rerun as rr
 import rerun.blueprint as rrb
 import numpy as np
+from scipy import ndimage
 from skimage import measure
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+try:
+    from cucim.skimage import measure as cucim_measure
+except ImportError:
+    cucim_measure = None
+
+
+# Tag numbers of the metadata elements, looked up directly instead of
+# translating keywords on every access
+SERIES_INSTANCE_UID_TAG = 0x0020000E
+SERIES_DESCRIPTION_TAG = 0x0008103E
+MODALITY_TAG = 0x00080060
+PATIENT_ID_TAG = 0x00100020
+INSTANCE_NUMBER_TAG = 0x00200013
+WINDOW_CENTER_TAG = 0x00281050
+WINDOW_WIDTH_TAG = 0x00281051
+RESCALE_INTERCEPT_TAG = 0x00281052
+RESCALE_SLOPE_TAG = 0x00281053
+
+# Tags read during the metadata pass; everything else is skipped
+DICOM_METADATA_TAGS = [
+    SERIES_INSTANCE_UID_TAG,
+    SERIES_DESCRIPTION_TAG,
+    MODALITY_TAG,
+    PATIENT_ID_TAG,
+    INSTANCE_NUMBER_TAG,
+    WINDOW_CENTER_TAG,
+    WINDOW_WIDTH_TAG,
+    RESCALE_SLOPE_TAG,
+    RESCALE_INTERCEPT_TAG
+]
+
+# Raw IS/DS strings that np.fromstring parses completely; anything else,
+# such as IS '1.0' or '1e3', is converted by pydicom. NumPy before 2.3 stops
+# at the first character it cannot parse with only a DeprecationWarning, so
+# the whole string is checked up front instead of relying on a ValueError.
+INTEGER_STRING_PATTERN = re.compile(r'\s*[+-]?\d+\s*(?:\\\s*[+-]?\d+\s*)*')
+DECIMAL_STRING_PATTERN = re.compile(
+    r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*'
+    r'(?:\\\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*)*'
+)
+
+# File signature checked before handing a file to pydicom
+DICOM_PREAMBLE_LENGTH = 128
+DICOM_MAGIC = b'DICM'
+LEGACY_DICOM_GROUP = b'\x08\x00'
+
+# Accept files without the Part 10 preamble and parse them with force=True
+ALLOW_LEGACY_DICOM = True
+
+# Extensions of sidecar files that are never DICOM and are skipped unread
+NON_DICOM_SUFFIXES = frozenset({
+    '.txt', '.json', '.xml', '.csv', '.md', '.html', '.pdf',
+    '.png', '.jpg', '.jpeg', '.zip', '.log', '.py'
+})
+
+# Pixel data that can be memory-mapped instead of decoded
+UNCOMPRESSED_TRANSFER_SYNTAXES = {
+    pydicom.uid.ExplicitVRLittleEndian,
+    pydicom.uid.ImplicitVRLittleEndian
+}
+PIXEL_DATA_TAG_BYTES = b'\xe0\x7f\x10\x00'
+UNDEFINED_LENGTH = 0xFFFFFFFF
+
+# Mesh thresholds as fractions of the volume's intensity range, one per
+# tissue density level
+MESH_THRESHOLDS = (0.3, 0.5, 0.7)
+
+# Tissue type shown for each mesh threshold, in threshold order
+TISSUE_TYPES = ('Soft Tissue', 'Medium Density', 'Bone/High Density')
+
+# RGBA mesh color for each threshold, pre-encoded as the uint8 values Rerun
+# stores; a single row is applied to every vertex of the mesh
+MESH_COLORS = (
+    np.array([[204, 51, 51, 178]], dtype=np.uint8),   # Red - Soft tissue
+    np.array([[51, 204, 51, 204]], dtype=np.uint8),   # Green - Medium density
+    np.array([[230, 230, 230, 230]], dtype=np.uint8)  # White - Bone/high density
+)
+
+# Metadata text templates, filled with str.format
+SERIES_METADATA_TEMPLATE = "\n".join([
+    "Series Description: {series_description}",
+    "Modality: {modality}",
+    "Patient ID: {patient_id}",
+    "Series UID: {series_uid}",
+    "Images: {image_count}"
+])
+IMAGE_METADATA_TEMPLATE = "\n".join([
+    "File Path: {file_path}",
+    "Instance Number: {instance_number}",
+    "Image Shape: {shape}",
+    "Image Data Type: {dtype}",
+    "Min Value: {min_value}",
+    "Max Value: {max_value}",
+    "Mean Value: {mean_value:.2f}"
+])
+VOLUME_METADATA_TEMPLATE = "\n".join([
+    "Min Value: {min_value}",
+    "Max Value: {max_value}",
+    "Mean Value: {mean_value:.2f}",
+    "Window Low: {window_low}",
+    "Window High: {window_high}"
+])
+MESH_METADATA_TEMPLATE = "\n".join([
+    "Mesh Level: {threshold:.1f}",
+    "Vertices: {vertices_count}",
+    "Faces: {faces_count}",
+    "Color: {tissue_type}",
+    "Series: {series_description}",
+    "Modality: {modality}"
+])
+
+# Threads started per CPU in thread mode, where workers mostly wait on reads
+THREADS_PER_CPU = 4
+
+# Marching cubes voxel step; None picks one from the volume size
+MESH_STEP_SIZE = None
+ADAPTIVE_STEP_VOXELS = 256
+
+# Series with fewer slices, such as localizers, get a tensor but no mesh
+MIN_SLICES_FOR_MESH = 8
+
+# Volumes with fewer voxels stay on the CPU even when cuCIM is installed;
+# below this the upload and launch overhead outweighs the GPU speedup
+GPU_MESH_MIN_VOXELS = 50_000_000
+
+# Step of the coarse pass that restricts full-resolution marching cubes to
+# the cells around the surfaces; None disables it
+MESH_OVERVIEW_STEP = 4
+
+logger = logging.getLogger("dicom_rerun")
+
 
 def create_blueprint():
     """
@@ -46,16 +198,47 @@ def create_blueprint():
     return blueprint
 
 
+# Built once and reused by every rr.init call
+BLUEPRINT = create_blueprint()
+
+
 def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('dicom_analysis.log'),
-            logging.StreamHandler()
-        ]
-    )
-    return logging.getLogger(__name__)
+    """
+    Configure console and file logging once.
+    
+    Called from main(). Later calls are no-ops, so the log file is not
+    reopened and no handlers are rebuilt when the root logger is already
+    configured.
+    
+    Returns:
+        logging.Logger: The module logger
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler('dicom_analysis.log'),
+                logging.StreamHandler()
+            ]
+        )
+    return logger
+
+
+def forward_worker_logging(log_queue, level):
+    """
+    Send a worker process's log records to the parent process.
+    
+    Runs as the process pool initializer; the parent's QueueListener hands
+    the records to its own handlers, so workers never open the log file.
+    
+    Args:
+        log_queue (multiprocessing.Queue): Queue read by the parent's listener
+        level (int): Level of the parent's root logger
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers = [QueueHandler(log_queue)]
+    root_logger.setLevel(level)
 
 
 def validate_folder_path(folder_path):
@@ -68,19 +251,113 @@ def validate_folder_path(folder_path):
     Returns:
         bool: True if valid, False otherwise
     """
-    logger = setup_logging()
-    
     if not folder_path.exists():
-        logger.error(f"Folder does not exist: {folder_path}")
+        logger.error("Folder does not exist: %s", folder_path)
         return False
     
     if not folder_path.is_dir():
-        logger.error(f"Path is not a directory: {folder_path}")
+        logger.error("Path is not a directory: %s", folder_path)
         return False
     
     return True
 
 
+def read_numeric_values(dicom_data, tag, dtype=np.float64):
+    """
+    Read an IS or DS element as a NumPy array straight from its raw bytes.
+    
+    Elements that have not been accessed yet are still raw byte strings, so
+    they can be parsed with np.fromstring in one call instead of going through
+    pydicom's per-value IS/DS conversion. Strings np.fromstring would not
+    parse completely, such as IS '1.0' or '1e3', go through pydicom instead.
+    
+    Args:
+        dicom_data: PyDICOM dataset object
+        tag (int): DICOM tag number of the element, e.g. INSTANCE_NUMBER_TAG
+        dtype (np.dtype): Data type of the returned values
+        
+    Returns:
+        np.ndarray: Parsed values, empty if the element is missing or empty
+        
+    Raises:
+        ValueError: If pydicom cannot convert the value either
+    """
+    if tag not in dicom_data:
+        return np.empty(0, dtype=dtype)
+    
+    value = dicom_data.get_item(tag).value
+    if value is None:
+        return np.empty(0, dtype=dtype)
+    
+    if isinstance(value, bytes):
+        text = value.decode('ascii', errors='ignore')
+        pattern = INTEGER_STRING_PATTERN if np.dtype(dtype).kind in 'iu' else DECIMAL_STRING_PATTERN
+        if pattern.fullmatch(text):
+            return np.fromstring(text, dtype=dtype, sep='\\')
+        
+        value = dicom_data[tag].value
+        if value is None or value == '':
+            return np.empty(0, dtype=dtype)
+    
+    # Converted by pydicom, e.g. after attribute access
+    return np.atleast_1d(np.asarray(value, dtype=dtype))
+
+
+def read_first_integer(dicom_data, tag, default=0):
+    """
+    Read the first value of an IS element as a Python int.
+    
+    Args:
+        dicom_data: PyDICOM dataset object
+        tag (int): DICOM tag number of the element
+        default (int): Value returned when the element is missing or empty
+        
+    Returns:
+        int: First value of the element or the default
+    """
+    values = read_numeric_values(dicom_data, tag, dtype=np.int64)
+    return int(values[0]) if values.size else default
+
+
+def read_first_float(dicom_data, tag, default=None):
+    """
+    Read the first value of a DS element as a Python float.
+    
+    Only optional display tags are read this way, so a value that cannot be
+    parsed falls back to the default instead of rejecting the file.
+    
+    Args:
+        dicom_data: PyDICOM dataset object
+        tag (int): DICOM tag number of the element
+        default (float, optional): Value returned when the element is missing,
+            empty or invalid
+        
+    Returns:
+        float or None: First value of the element or the default
+    """
+    try:
+        values = read_numeric_values(dicom_data, tag, dtype=np.float64)
+    except (ValueError, TypeError, OverflowError):
+        logger.debug("Ignoring invalid value of tag %08X", tag)
+        return default
+    return float(values[0]) if values.size else default
+
+
+def read_string(dicom_data, tag, default):
+    """
+    Read a string element by tag number.
+    
+    Args:
+        dicom_data: PyDICOM dataset object
+        tag (int): DICOM tag number of the element
+        default (str): Value returned when the element is missing
+        
+    Returns:
+        str: Value of the element or the default
+    """
+    return dicom_data[tag].value if tag in dicom_data else default
+
+
 def extract_dicom_metadata(dicom_data):
     """
     Extract relevant metadata from a DICOM dataset.
@@ -92,94 +369,484 @@ def extract_dicom_metadata(dicom_data):
         dict: Dictionary containing extracted metadata
     """
     return {
-        'series_uid': getattr(dicom_data, 'SeriesInstanceUID', 'UNKNOWN_SERIES'),
-        'series_description': getattr(dicom_data, 'SeriesDescription', 'N/A'),
-        'modality': getattr(dicom_data, 'Modality', 'N/A'),
-        'patient_id': getattr(dicom_data, 'PatientID', 'N/A'),
-        'instance_number': getattr(dicom_data, 'InstanceNumber', 0)
+        'series_uid': read_string(dicom_data, SERIES_INSTANCE_UID_TAG, 'UNKNOWN_SERIES'),
+        'series_description': read_string(dicom_data, SERIES_DESCRIPTION_TAG, 'N/A'),
+        'modality': read_string(dicom_data, MODALITY_TAG, 'N/A'),
+        'patient_id': read_string(dicom_data, PATIENT_ID_TAG, 'N/A'),
+        'instance_number': read_first_integer(dicom_data, INSTANCE_NUMBER_TAG),
+        'window_center': read_first_float(dicom_data, WINDOW_CENTER_TAG),
+        'window_width': read_first_float(dicom_data, WINDOW_WIDTH_TAG),
+        'rescale_slope': read_first_float(dicom_data, RESCALE_SLOPE_TAG, 1.0),
+        'rescale_intercept': read_first_float(dicom_data, RESCALE_INTERCEPT_TAG, 0.0)
     }
 
 
-def process_single_dicom_file(file_path):
+def has_dicom_signature(file_path):
     """
-    Process a single DICOM file and extract its data and metadata.
+    Check whether a file looks like DICOM without parsing it.
+    
+    Files with a known non-DICOM extension are rejected without being opened.
+    Part 10 files carry the 'DICM' magic after a 128 byte preamble. Legacy
+    files written without the preamble start directly with a little endian
+    group 0x0008 element; those are let through only if ALLOW_LEGACY_DICOM
+    is set.
     
     Args:
-        file_path (Path): Path to the DICOM file
+        file_path (str): Path to the file
         
     Returns:
-        dict or None: DICOM file information dictionary or None if processing failed
+        bool: True if the file should be handed to pydicom
+    """
+    if os.path.splitext(file_path)[1].lower() in NON_DICOM_SUFFIXES:
+        return False
+    
+    with open(file_path, 'rb') as file:
+        header = file.read(DICOM_PREAMBLE_LENGTH + len(DICOM_MAGIC))
+    
+    if header[DICOM_PREAMBLE_LENGTH:] == DICOM_MAGIC:
+        return True
+    
+    return ALLOW_LEGACY_DICOM and header[:2] == LEGACY_DICOM_GROUP
+
+
+def read_dicom_metadata(file_path):
     """
-    logger = setup_logging()
+    Read the sorting and display metadata of a single DICOM file.
     
+    Only the tags in DICOM_METADATA_TAGS are parsed and reading stops before
+    the pixel data, so this pass stays cheap; pixels are loaded on demand by
+    load_pixel_array once the files are sorted.
+    
+    Args:
+        file_path (str): Path to the DICOM file
+        
+    Returns:
+        dict or None: DICOM file information dictionary or None if processing failed
+    """
     try:
-        dicom_data = pydicom.dcmread(str(file_path), force=True)
-        metadata = extract_dicom_metadata(dicom_data)
+        if not has_dicom_signature(file_path):
+            logger.debug("Skipping non-DICOM file: %s", file_path)
+            return None
         
-        logger.info(f"Processing instance: {metadata['instance_number']}")
+        dicom_data = pydicom.dcmread(
+            file_path,
+            specific_tags=DICOM_METADATA_TAGS,
+            stop_before_pixels=True,
+            force=ALLOW_LEGACY_DICOM
+        )
+        metadata = extract_dicom_metadata(dicom_data)
         
-        if hasattr(dicom_data, 'pixel_array'):
-            return {
-                'file_path': file_path,
-                'dicom_data': dicom_data,
-                'pixel_array': dicom_data.pixel_array,
-                **metadata
-            }
-        else:
-            logger.warning(f"No pixel data found in file: {file_path}")
-            return None
+        # Only plain metadata is returned so the result pickles cheaply when
+        # this runs inside a worker process.
+        return {
+            'file_path': file_path,
+            **metadata
+        }
             
     except Exception as e:
-        logger.error(f"Error processing file {file_path}: {str(e)}")
+        # Corrupt files fail in many ways inside pydicom (struct.error,
+        # NotImplementedError, ...); one bad file must not abort the scan
+        logger.warning("Skipping %s: %s", file_path, e)
+        return None
+
+
+def as_native_contiguous(pixel_array):
+    """
+    Return a C-contiguous, native byte order version of a pixel array.
+    
+    Rerun serializes arrays as-is only when they are in this layout; otherwise
+    it copies them on every rr.log call. Converting once at load time means
+    arrays that already qualify are returned without a copy.
+    
+    Args:
+        pixel_array (np.ndarray): Decoded pixel data
+        
+    Returns:
+        np.ndarray: Array safe to hand to Rerun without further copies
+    """
+    if not pixel_array.dtype.isnative:
+        pixel_array = pixel_array.astype(pixel_array.dtype.newbyteorder('='))
+    return np.ascontiguousarray(pixel_array)
+
+
+def get_uncompressed_pixel_layout(header):
+    """
+    Get the dtype and shape of pixel data that can be mapped without decoding.
+    
+    Only single-frame, single-sample images in a little endian, uncompressed
+    transfer syntax qualify; everything else needs pydicom's decoders.
+    
+    Args:
+        header: PyDICOM dataset read with stop_before_pixels
+        
+    Returns:
+        tuple or None: (dtype, shape, implicit VR flag), or None if the pixel
+            data has to be decoded by pydicom
+    """
+    file_meta = getattr(header, 'file_meta', None)
+    transfer_syntax = file_meta.get('TransferSyntaxUID') if file_meta is not None else None
+    if transfer_syntax not in UNCOMPRESSED_TRANSFER_SYNTAXES:
+        return None
+    
+    bits_allocated = header.get('BitsAllocated')
+    pixel_representation = header.get('PixelRepresentation')
+    rows = header.get('Rows')
+    columns = header.get('Columns')
+    
+    if (
+        header.get('SamplesPerPixel', 1) != 1
+        or int(header.get('NumberOfFrames') or 1) != 1
+        or bits_allocated not in (8, 16, 32)
+        or pixel_representation not in (0, 1)
+        or not rows
+        or not columns
+    ):
+        return None
+    
+    kind = 'i' if pixel_representation else 'u'
+    dtype = np.dtype(f"<{kind}{bits_allocated // 8}")
+    return dtype, (rows, columns), transfer_syntax == pydicom.uid.ImplicitVRLittleEndian
+
+
+def mask_unused_bits(pixel_array, header):
+    """
+    Clear or sign-extend the bits above BitsStored, as pydicom does on decode.
+    
+    Args:
+        pixel_array (np.ndarray): Raw stored pixel values
+        header: PyDICOM dataset with the image pixel module
+        
+    Returns:
+        np.ndarray: The array itself when all allocated bits are used,
+            otherwise a corrected copy
+    """
+    bits_allocated = pixel_array.dtype.itemsize * 8
+    bits_stored = header.get('BitsStored') or bits_allocated
+    if bits_stored >= bits_allocated:
+        return pixel_array
+    
+    if pixel_array.dtype.kind == 'i':
+        shift = bits_allocated - bits_stored
+        return (pixel_array << shift) >> shift
+    return pixel_array & ((1 << bits_stored) - 1)
+
+
+def locate_uncompressed_pixel_data(file):
+    """
+    Find the position and layout of uncompressed pixel data in a DICOM file.
+    
+    The header is parsed up to the PixelData element, which leaves the file
+    positioned at the element's tag.
+    
+    Args:
+        file: Binary file object positioned at the start of the DICOM file
+        
+    Returns:
+        tuple or None: (header, dtype, shape, value offset), or None if the
+            pixel data has to be decoded by pydicom
+    """
+    header = pydicom.dcmread(file, stop_before_pixels=True, force=True)
+    element_offset = file.tell()
+    element_header = file.read(12)
+    
+    layout = get_uncompressed_pixel_layout(header)
+    if layout is None or element_header[:4] != PIXEL_DATA_TAG_BYTES:
+        return None
+    
+    dtype, shape, is_implicit_vr = layout
+    if is_implicit_vr:
+        value_length = int.from_bytes(element_header[4:8], 'little')
+        value_offset = element_offset + 8
+    else:
+        value_length = int.from_bytes(element_header[8:12], 'little')
+        value_offset = element_offset + 12
+    
+    if value_length == UNDEFINED_LENGTH or value_length < shape[0] * shape[1] * dtype.itemsize:
+        return None
+    
+    return header, dtype, shape, value_offset
+
+
+def map_uncompressed_pixel_array(file_path, raw_bytes=None):
+    """
+    Map the pixel data of an uncompressed image without pydicom's decoder.
+    
+    Only the header is parsed; the PixelData value is then viewed in place,
+    inside raw_bytes when the file has already been read or memory-mapped
+    from the file otherwise. This saves pydicom's full parse and pixel
+    decode, not the copies made afterwards: a worker process still pickles
+    the array back to its parent, and the volume is stacked from copies.
+    
+    Args:
+        file_path (str): Path to the DICOM file
+        raw_bytes (bytes, optional): File contents already read from disk
+        
+    Returns:
+        np.ndarray or None: Pixel array, or None if the file has to be decoded
+            by pydicom
+    """
+    source = io.BytesIO(raw_bytes) if raw_bytes is not None else open(file_path, 'rb')
+    with source as file:
+        location = locate_uncompressed_pixel_data(file)
+    
+    if location is None:
+        return None
+    
+    header, dtype, shape, value_offset = location
+    if raw_bytes is not None:
+        pixel_array = np.frombuffer(
+            raw_bytes, dtype=dtype, count=shape[0] * shape[1], offset=value_offset
+        ).reshape(shape)
+    else:
+        pixel_array = np.memmap(file_path, dtype=dtype, mode='r', offset=value_offset, shape=shape)
+    
+    return mask_unused_bits(pixel_array, header)
+
+
+def decode_pixel_array(file_path, raw_bytes=None):
+    """
+    Decode the pixel array of a DICOM file with pydicom.
+    
+    Args:
+        file_path (str): Path to the DICOM file
+        raw_bytes (bytes, optional): File contents already read from disk
+        
+    Returns:
+        np.ndarray or None: Pixel array, or None if the file has no pixel data
+    """
+    source = io.BytesIO(raw_bytes) if raw_bytes is not None else file_path
+    dicom_data = pydicom.dcmread(source, force=True)
+    
+    # Checking for the element avoids decoding pixels just to test for them
+    if 'PixelData' not in dicom_data:
+        logger.warning("No pixel data found in file: %s", file_path)
+        return None
+    
+    return dicom_data.pixel_array
+
+
+def load_pixel_array(file_path, raw_bytes=None):
+    """
+    Load the pixel array of a DICOM file.
+    
+    Uncompressed images are mapped directly; other transfer syntaxes fall
+    back to pydicom's decoders.
+    
+    Args:
+        file_path (str): Path to the DICOM file
+        raw_bytes (bytes, optional): File contents already read from disk; the
+            file is opened and read when omitted
+        
+    Returns:
+        np.ndarray or None: Pixel array, or None if the file has no pixel data
+            or could not be decoded
+    """
+    try:
+        pixel_array = map_uncompressed_pixel_array(file_path, raw_bytes)
+        if pixel_array is None:
+            pixel_array = decode_pixel_array(file_path, raw_bytes)
+        
+        return as_native_contiguous(pixel_array) if pixel_array is not None else None
+        
+    except Exception as e:
+        logger.error("Error loading pixel data from %s: %s", file_path, e)
+        return None
+
+
+@contextmanager
+def create_worker_pool(use_threads=False):
+    """
+    Create the worker pool used to read and decode DICOM files and to
+    extract meshes.
+    
+    Processes are used by default. Threads are a better fit for slow network
+    storage, where reads dominate and pydicom's C-level decoding releases the
+    GIL; since they mostly wait on I/O, THREADS_PER_CPU are started per CPU
+    to keep enough reads in flight.
+    If the parent has configured logging, worker processes send their
+    records back to its handlers through a queue, whichever start method is
+    in use; otherwise the workers' logging is left alone too.
+    
+    Args:
+        use_threads (bool): Use a thread pool instead of a process pool
+        
+    Yields:
+        concurrent.futures.Executor: The running pool
+    """
+    if use_threads:
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * THREADS_PER_CPU) as executor:
+            yield executor
+        return
+    
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            yield executor
+        return
+    
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=forward_worker_logging,
+            initargs=(log_queue, root_logger.level)
+        ) as executor:
+            yield executor
+    finally:
+        listener.stop()
+
+
+def read_file_bytes(file_path):
+    """
+    Read the whole contents of a file.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        bytes or None: File contents, or None if the file could not be read
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            return file.read()
+    except OSError as e:
+        logger.error("Error reading file %s: %s", file_path, e)
         return None
 
 
-def scan_dicom_files(folder_path):
+def prefetch_map(function, items, executor, max_pending=8):
     """
-    Scan a folder recursively for DICOM files and process them.
+    Lazily apply a function to items on a background pool, preserving order.
+    
+    At most max_pending calls are queued or running at once, so a slow
+    consumer bounds memory while the workers keep the next items ready.
+    
+    Args:
+        function (callable): Function to apply, typically I/O bound
+        items (iterable): Items to process
+        executor (concurrent.futures.Executor): Pool running the calls
+        max_pending (int): Maximum number of results held ahead of the consumer
+        
+    Yields:
+        Results of function in the same order as items
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, item))
+    
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_files(folder_path):
+    """
+    Recursively yield the paths of all regular files below a folder.
+    
+    os.scandir reuses the file type reported by the directory listing, so
+    there is no extra stat call per entry as with Path.rglob and is_file.
+    Directories are walked from an explicit stack, so deep trees neither
+    hit the recursion limit nor stack up nested generators. Directories that
+    cannot be listed are skipped with a warning.
+    
+    Args:
+        folder_path (str or Path): Folder to walk
+        
+    Yields:
+        str: Path of each file
+    """
+    pending_dirs = [os.fspath(folder_path)]
+    
+    while pending_dirs:
+        dir_path = pending_dirs.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        yield entry.path
+                    elif entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+        except OSError as e:
+            logger.warning("Skipping unreadable directory %s: %s", dir_path, e)
+
+
+def scan_dicom_files(folder_path, executor):
+    """
+    Scan a folder recursively for DICOM files and read their metadata in parallel.
     
     Args:
         folder_path (Path): Path to the folder containing DICOM files
+        executor (concurrent.futures.Executor): Pool to read the files with
         
     Returns:
-        tuple: (dicom_files list, total_files count, valid_files count, invalid_files count)
+        tuple: (dicom_files list, total_files count)
     """
-    logger = setup_logging()
-    logger.info(f"Starting to scan DICOM files from: {folder_path}")
+    logger.info("Starting to scan DICOM files from: %s", folder_path)
     
-    total_files = 0
-    valid_dicom_files = 0
-    invalid_files = 0
-    dicom_files = []
+    file_paths = list(iter_files(folder_path))
+    results = executor.map(read_dicom_metadata, file_paths, chunksize=16)
+    dicom_files = [file_info for file_info in results if file_info]
     
-    for file_path in folder_path.rglob('*'):
-        if file_path.is_file():
-            total_files += 1
-            
-            file_info = process_single_dicom_file(file_path)
-            if file_info:
-                dicom_files.append(file_info)
-                valid_dicom_files += 1
-            else:
-                invalid_files += 1
+    return dicom_files, len(file_paths)
+
+
+def load_series_pixel_arrays(series_files, executor, use_threads=False):
+    """
+    Load the pixel arrays of one series into its file dictionaries.
+    
+    Pixels are only decoded when their series is about to be logged, so at
+    most one series' pixel data is held in memory at a time.
     
-    return dicom_files, total_files, valid_dicom_files, invalid_files
+    Args:
+        series_files (list): Sorted list of DICOM files in the series
+        executor (concurrent.futures.Executor): Pool to read the files with
+        use_threads (bool): Whether executor is a thread pool; if so it only
+            prefetches file bytes and decoding happens on this thread
+        
+    Returns:
+        list: The series files that have a 'pixel_array', in the same order
+    """
+    file_paths = [file_info['file_path'] for file_info in series_files]
+    
+    if use_threads:
+        # Slow storage: background threads fetch file bytes while this thread
+        # decodes the ones already read
+        pixel_arrays = (
+            load_pixel_array(file_path, raw_bytes) if raw_bytes is not None else None
+            for file_path, raw_bytes in zip(file_paths, prefetch_map(read_file_bytes, file_paths, executor))
+        )
+    else:
+        pixel_arrays = executor.map(load_pixel_array, file_paths, chunksize=4)
+    
+    loaded_files = []
+    for file_info, pixel_array in zip(series_files, pixel_arrays):
+        if pixel_array is not None:
+            file_info['pixel_array'] = pixel_array
+            loaded_files.append(file_info)
+    
+    return loaded_files
 
 
 def sort_dicom_files(dicom_files):
     """
     Sort DICOM files by series UID and instance number.
     
+    The key tuple of each file is built once by operator.itemgetter in C,
+    and Timsort runs in linear time on folders that were already listed in
+    order.
+    
     Args:
         dicom_files (list): List of DICOM file dictionaries
         
     Returns:
         list: Sorted list of DICOM files
     """
-    logger = setup_logging()
     logger.info("Sorting DICOM files by series UID, then by instance number")
     
-    dicom_files.sort(key=lambda x: (x['series_uid'], x['instance_number']))
+    dicom_files.sort(key=itemgetter('series_uid', 'instance_number'))
     return dicom_files
 
 
@@ -192,19 +859,21 @@ def log_loading_summary(total_files, valid_files, invalid_files):
         valid_files (int): Number of valid DICOM files
         invalid_files (int): Number of invalid files
     """
-    logger = setup_logging()
     logger.info("Loading complete!")
-    logger.info(f"Total files: {total_files}")
-    logger.info(f"Valid DICOM files: {valid_files}")
-    logger.info(f"Invalid files: {invalid_files}")
+    logger.info("Total files: %d", total_files)
+    logger.info("Valid DICOM files: %d", valid_files)
+    logger.info("Invalid files: %d", invalid_files)
 
 
-def load_and_sort_dicom_files(folder_path):
+def load_and_sort_dicom_files(folder_path, executor):
     """
-    Load and sort DICOM files from a folder.
+    Load and sort the metadata of DICOM files from a folder.
+    
+    Pixel data is not read here; see load_series_pixel_arrays.
     
     Args:
         folder_path (str): Path to the folder containing DICOM files
+        executor (concurrent.futures.Executor): Pool to read the files with
         
     Returns:
         list: Sorted list of DICOM file metadata dictionaries
@@ -214,110 +883,370 @@ def load_and_sort_dicom_files(folder_path):
     if not validate_folder_path(folder_path):
         return []
     
-    dicom_files, total_files, valid_files, invalid_files = scan_dicom_files(folder_path)
+    dicom_files, total_files = scan_dicom_files(folder_path, executor)
     dicom_files = sort_dicom_files(dicom_files)
-    log_loading_summary(total_files, valid_files, invalid_files)
+    
+    valid_files = len(dicom_files)
+    log_loading_summary(total_files, valid_files, total_files - valid_files)
     
     return dicom_files
 
 
-def create_image_metadata_text(file_info):
+if numba is not None:
+    @numba.njit(nogil=True, cache=True)
+    def fused_pixel_statistics(flat):
+        """
+        Compute min, max and sum of integer pixels in a single pass.
+        
+        The int64 accumulator keeps the loop vectorizable; float pixels are
+        left to NumPy, which is faster for them than a sequential float sum.
+        
+        Args:
+            flat (np.ndarray): Non-empty 1D array of integers up to 32 bits
+            
+        Returns:
+            tuple: (min, max, sum)
+        """
+        min_value = flat[0]
+        max_value = flat[0]
+        total = 0
+        for index in range(flat.size):
+            value = flat[index]
+            if value < min_value:
+                min_value = value
+            if value > max_value:
+                max_value = value
+            total += np.int64(value)
+        return min_value, max_value, total
+
+
+def get_sum_dtype(dtype):
+    """
+    Choose the accumulator type for summing pixels of a given data type.
+    
+    Args:
+        dtype (np.dtype): Pixel data type
+        
+    Returns:
+        type: np.int64 for integer types up to 32 bits, np.float64 otherwise
+    """
+    if dtype.kind in 'iub' and dtype.itemsize <= 4:
+        return np.int64
+    return np.float64
+
+
+def compute_pixel_statistics(pixel_array):
+    """
+    Compute summary statistics of a pixel array.
+    
+    With numba installed, integer pixels get all statistics from one pass
+    that releases the GIL. Otherwise the array is flattened once and summed
+    without materialising a converted copy. Either way integer pixels are
+    summed exactly in an int64 accumulator, which skips the per-element float
+    conversion.
+    
+    Args:
+        pixel_array (np.ndarray): Image or volume data
+        
+    Returns:
+        tuple: (min, max, mean)
+    """
+    flat = pixel_array.ravel()
+    sum_dtype = get_sum_dtype(flat.dtype)
+    
+    if numba is not None and flat.size and sum_dtype is np.int64:
+        min_value, max_value, total = fused_pixel_statistics(flat)
+    else:
+        min_value, max_value = flat.min(), flat.max()
+        total = flat.sum(dtype=sum_dtype)
+    
+    return min_value, max_value, total / flat.size
+
+
+def compute_value_range(array):
+    """
+    Compute the minimum and maximum of an array.
+    
+    With numba installed, integer arrays get both from the fused single pass
+    used for the pixel statistics instead of two separate reductions.
+    
+    Args:
+        array (np.ndarray): Image or volume data
+        
+    Returns:
+        tuple: (min, max) as Python floats
+    """
+    flat = array.ravel()
+    
+    if numba is not None and flat.size and get_sum_dtype(flat.dtype) is np.int64:
+        min_value, max_value, _ = fused_pixel_statistics(flat)
+    else:
+        min_value, max_value = flat.min(), flat.max()
+    
+    return float(min_value), float(max_value)
+
+
+def create_series_metadata_text(series_files):
+    """
+    Create metadata text shared by all images of a series.
+    
+    Args:
+        series_files (list): Sorted list of DICOM files in the series
+        
+    Returns:
+        str: Formatted metadata text
+    """
+    file_info = series_files[0]
+    
+    return SERIES_METADATA_TEMPLATE.format(
+        series_description=file_info['series_description'],
+        modality=file_info['modality'],
+        patient_id=file_info['patient_id'],
+        series_uid=file_info['series_uid'],
+        image_count=len(series_files)
+    )
+
+
+def create_image_metadata_text(file_info, pixel_statistics):
     """
     Create metadata text for a DICOM image.
     
+    Only the values that change from slice to slice are included; the
+    series-level fields are logged once by create_series_metadata_text.
+    
     Args:
         file_info (dict): DICOM file information dictionary
+        pixel_statistics (tuple): (min, max, mean) from compute_pixel_statistics
         
     Returns:
         str: Formatted metadata text
     """
     pixel_array = file_info['pixel_array']
+    min_value, max_value, mean_value = pixel_statistics
+    
+    return IMAGE_METADATA_TEMPLATE.format(
+        file_path=file_info['file_path'],
+        instance_number=file_info['instance_number'],
+        shape=pixel_array.shape,
+        dtype=pixel_array.dtype,
+        min_value=min_value,
+        max_value=max_value,
+        mean_value=mean_value
+    )
+
+
+def get_display_window(file_info, value_range):
+    """
+    Get the display window of an image in stored pixel value units.
+    
+    The DICOM window is defined on rescaled values (e.g. Hounsfield units), so
+    it is mapped back through the rescale slope and intercept. Images without
+    a window use their full value range.
     
-    return f"""
-Series Description: {file_info['series_description']}
-Modality: {file_info['modality']}
-Patient ID: {file_info['patient_id']}
-Instance Number: {file_info['instance_number']}
-Image Shape: {pixel_array.shape}
-Image Data Type: {pixel_array.dtype}
-Min Value: {np.min(pixel_array)}
-Max Value: {np.max(pixel_array)}
-Mean Value: {np.mean(pixel_array):.2f}
-File Path: {file_info['file_path']}
-    """.strip()
+    Args:
+        file_info (dict): DICOM file information dictionary
+        value_range (tuple): (min, max) of the image's pixel values
+        
+    Returns:
+        tuple: (low, high) stored pixel values mapped to black and white
+    """
+    window_center = file_info.get('window_center')
+    window_width = file_info.get('window_width')
+    
+    if window_center is None or not window_width:
+        return float(value_range[0]), float(value_range[1])
+    
+    slope = file_info.get('rescale_slope') or 1.0
+    intercept = file_info.get('rescale_intercept') or 0.0
+    low = (window_center - window_width / 2 - intercept) / slope
+    high = (window_center + window_width / 2 - intercept) / slope
+    return min(low, high), max(low, high)
 
 
-def log_single_dicom_image(file_info):
+def window_to_uint8(pixel_array, low, high):
     """
-    Log a single DICOM image and its metadata to Rerun.
+    Map pixel values inside a display window to the 0-255 range.
+    
+    Args:
+        pixel_array (np.ndarray): Image data
+        low (float): Value mapped to 0
+        high (float): Value mapped to 255
+        
+    Returns:
+        np.ndarray: uint8 image, half the size of 16-bit input
+    """
+    if high <= low:
+        return np.zeros(pixel_array.shape, dtype=np.uint8)
+    
+    scaled = pixel_array.astype(np.float32)
+    scaled -= low
+    scaled *= 255.0 / (high - low)
+    np.clip(scaled, 0, 255, out=scaled)
+    return scaled.astype(np.uint8)
+
+
+def prepare_image_for_logging(file_info):
+    """
+    Compute the display image and metadata text for a DICOM slice.
     
     Args:
         file_info (dict): DICOM file information dictionary
+        
+    Returns:
+        tuple: (windowed uint8 image, metadata text)
+    """
+    # Reductions over the image run once and feed the window, the text and,
+    # through the file record, the volume statistics
+    pixel_statistics = compute_pixel_statistics(file_info['pixel_array'])
+    file_info['pixel_statistics'] = pixel_statistics
+    
+    # A windowed 8-bit copy is logged for display; the raw values go to the tensor
+    low, high = get_display_window(file_info, pixel_statistics[:2])
+    display_image = window_to_uint8(file_info['pixel_array'], low, high)
+    metadata_text = create_image_metadata_text(file_info, pixel_statistics)
+    
+    return display_image, metadata_text
+
+
+def log_single_dicom_image(file_info):
     """
-    logger = setup_logging()
+    Log a single DICOM image and its metadata to Rerun on the instance timeline.
     
+    Args:
+        file_info (dict): DICOM file information dictionary
+    """
     series_uid = file_info['series_uid']
     entity_path = f"series/{series_uid}"
+    display_image, metadata_text = prepare_image_for_logging(file_info)
     
-    # Log the image
-    rr.log(entity_path, rr.Image(file_info['pixel_array']))
-    
-    # Log the metadata
-    metadata_text = create_image_metadata_text(file_info)
+    rr.set_time("instance", sequence=file_info['instance_number'])
+    rr.log(entity_path, rr.Image(display_image))
     rr.log(f"{entity_path}/metadata", rr.TextDocument(metadata_text))
+    rr.disable_timeline("instance")
     
-    # Log progress
-    logger.info(f"Logged DICOM: {file_info['instance_number']}")
-    logger.info(f"  Series: {series_uid}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Logged DICOM instance %s of series %s", file_info['instance_number'], series_uid)
 
 
-def log_individual_series(dicom_files):
+def can_batch_series_images(series_files):
     """
-    Log individual DICOM images to Rerun by series.
+    Check whether all images of a series are 2D slices of the same shape.
     
     Args:
-        dicom_files (list): Sorted list of DICOM file metadata
+        series_files (list): List of DICOM files in the series
+        
+    Returns:
+        bool: True if the series can be sent as a single image column
     """
-    logger = setup_logging()
-    logger.info("Logging individual series to Rerun")
-    
-    for file_info in dicom_files:
-        log_single_dicom_image(file_info)
+    first_shape = series_files[0]['pixel_array'].shape
+    return len(first_shape) == 2 and all(
+        file_info['pixel_array'].shape == first_shape for file_info in series_files
+    )
 
 
-def normalize_volume(volume_3d):
+def get_metadata_column(dicom_files, key, dtype=None):
     """
-    Normalize 3D volume data to range [0, 1].
+    Gather one metadata field of every DICOM file into a NumPy array, such
+    as the instance numbers of the Rerun timeline column.
     
     Args:
-        volume_3d (np.ndarray): 3D volume data
+        dicom_files (list): List of DICOM file dictionaries
+        key (str): Metadata field to gather
+        dtype (np.dtype, optional): Array data type; inferred when omitted
         
     Returns:
-        np.ndarray: Normalized volume data
+        np.ndarray: Field values in file order
     """
-    min_val = np.min(volume_3d)
-    max_val = np.max(volume_3d)
+    return np.array([file_info[key] for file_info in dicom_files], dtype=dtype)
+
+
+def log_series_images(series_uid, series_files):
+    """
+    Log all images of a series to Rerun in one columnar batch.
+    
+    The series metadata and image format are logged once as static data and
+    every slice buffer and metadata text is sent with rr.send_columns on the
+    "instance" timeline, so a series costs a few SDK calls instead of two per
+    slice. Series with mixed or non-2D shapes fall back to logging slice by
+    slice.
     
-    if max_val == min_val:
-        return np.zeros_like(volume_3d)
+    Args:
+        series_uid (str): Series UID
+        series_files (list): Sorted list of DICOM files in the series
+    """
+    # Fields shared by the whole series are logged once, not with every slice
+    rr.log(
+        f"series/{series_uid}/info",
+        rr.TextDocument(create_series_metadata_text(series_files)),
+        static=True
+    )
     
-    return (volume_3d - min_val) / (max_val - min_val)
+    if not can_batch_series_images(series_files):
+        for file_info in series_files:
+            log_single_dicom_image(file_info)
+        return
+    
+    entity_path = f"series/{series_uid}"
+    height, width = series_files[0]['pixel_array'].shape
+    display_images = np.empty((len(series_files), height, width), dtype=np.uint8)
+    metadata_texts = []
+    
+    for index, file_info in enumerate(series_files):
+        display_images[index], metadata_text = prepare_image_for_logging(file_info)
+        metadata_texts.append(metadata_text)
+    
+    instance_column = rr.TimeColumn(
+        "instance",
+        sequence=get_metadata_column(series_files, 'instance_number', dtype=np.int64)
+    )
+    image_format = rr.components.ImageFormat(
+        width=width,
+        height=height,
+        color_model="L",
+        channel_datatype="U8"
+    )
+    
+    rr.log(entity_path, rr.Image.from_fields(format=image_format), static=True)
+    rr.send_columns(
+        entity_path,
+        indexes=[instance_column],
+        columns=rr.Image.columns(buffer=display_images.reshape(len(series_files), -1))
+    )
+    rr.send_columns(
+        f"{entity_path}/metadata",
+        indexes=[instance_column],
+        columns=rr.TextDocument.columns(text=metadata_texts)
+    )
 
 
 def get_mesh_configuration():
     """
-    Get mesh thresholds and colors configuration.
+    Get mesh thresholds, colors and marching cubes step size configuration.
     
     Returns:
-        tuple: (thresholds list, colors list)
+        tuple: (thresholds, uint8 RGBA colors, step size or None for adaptive)
     """
-    thresholds = [0.3, 0.5, 0.7]  # Different tissue density levels
-    colors = [
-        [0.8, 0.2, 0.2, 0.7],  # Red - Soft tissue
-        [0.2, 0.8, 0.2, 0.8],  # Green - Medium density
-        [0.9, 0.9, 0.9, 0.9]   # White - Bone/high density
-    ]
-    return thresholds, colors
+    return MESH_THRESHOLDS, MESH_COLORS, MESH_STEP_SIZE
+
+
+def get_marching_cubes_step_size(volume_shape, step_size=None):
+    """
+    Get the voxel step used by marching cubes for a volume.
+    
+    Larger steps trade surface detail for speed: a step of 2 visits about an
+    eighth of the voxels. When no step is configured it grows with the volume,
+    keeping full resolution for volumes up to 511 voxels along each axis.
+    
+    Args:
+        volume_shape (tuple): Shape of the volume
+        step_size (int, optional): Configured step size
+        
+    Returns:
+        int: Step size of at least 1
+    """
+    if step_size is not None:
+        return max(1, int(step_size))
+    return max(1, max(volume_shape) // ADAPTIVE_STEP_VOXELS)
 
 
 def get_tissue_type_name(threshold_index):
@@ -330,8 +1259,7 @@ def get_tissue_type_name(threshold_index):
     Returns:
         str: Tissue type name
     """
-    tissue_types = ['Soft Tissue', 'Medium Density', 'Bone/High Density']
-    return tissue_types[threshold_index] if threshold_index < len(tissue_types) else 'Unknown'
+    return TISSUE_TYPES[threshold_index] if threshold_index < len(TISSUE_TYPES) else 'Unknown'
 
 
 def create_mesh_metadata_text(threshold, vertices_count, faces_count, tissue_type, metadata_info):
@@ -348,40 +1276,109 @@ def create_mesh_metadata_text(threshold, vertices_count, faces_count, tissue_typ
     Returns:
         str: Formatted metadata text
     """
-    return f"""
-Mesh Level: {threshold:.1f}
-Vertices: {vertices_count}
-Faces: {faces_count}
-Color: {tissue_type}
-Series: {metadata_info['series_description']}
-Modality: {metadata_info['modality']}
-    """.strip()
+    return MESH_METADATA_TEMPLATE.format(
+        threshold=threshold,
+        vertices_count=vertices_count,
+        faces_count=faces_count,
+        tissue_type=tissue_type,
+        series_description=metadata_info['series_description'],
+        modality=metadata_info['modality']
+    )
 
 
-def extract_mesh_with_marching_cubes(volume_normalized, threshold):
+def build_surface_mask(volume, levels, overview_step):
     """
-    Extract mesh from normalized volume using marching cubes algorithm.
+    Mark the cells near the surfaces at the given levels from a coarse pass.
+    
+    Marching cubes runs at overview_step for every level, the cells holding
+    the coarse vertices are dilated by one coarse cell to catch detail that
+    fell between samples, and the result is upsampled to the volume shape.
+    The coarse pass never samples the voxels after the last multiple of
+    overview_step along an axis, so that last plane of coarse cells is always
+    kept. Passed as mask to the fine passes, it lets them skip empty space.
     
     Args:
-        volume_normalized (np.ndarray): Normalized 3D volume data
-        threshold (float): Threshold level for mesh extraction
+        volume (np.ndarray): Contiguous float32 3D volume data
+        levels (list): Intensity levels of the surfaces
+        overview_step (int): Voxel step of the coarse pass
+        
+    Returns:
+        np.ndarray or None: Boolean mask of the volume shape, or None if the
+            coarse pass failed and the full volume should be searched
+    """
+    coarse_shape = tuple(-(-size // overview_step) for size in volume.shape)
+    coarse_mask = np.zeros(coarse_shape, dtype=bool)
+    last_cell = np.array(coarse_shape) - 1
+    
+    for level in levels:
+        try:
+            vertices = measure.marching_cubes(volume, level=level, step_size=overview_step)[0]
+        except (ValueError, RuntimeError):
+            return None
+        
+        cells = np.minimum((vertices // overview_step).astype(np.intp), last_cell)
+        coarse_mask[tuple(cells.T)] = True
+    
+    # Full connectivity, so cells touching only at an edge or corner are kept
+    coarse_mask = ndimage.binary_dilation(
+        coarse_mask, structure=ndimage.generate_binary_structure(volume.ndim, volume.ndim)
+    )
+    
+    for axis, size in enumerate(volume.shape):
+        if (size - 1) % overview_step:
+            trailing_cells = [slice(None)] * volume.ndim
+            trailing_cells[axis] = -1
+            coarse_mask[tuple(trailing_cells)] = True
+    
+    mask = coarse_mask
+    for axis in range(volume.ndim):
+        mask = mask.repeat(overview_step, axis=axis)
+    
+    return np.ascontiguousarray(mask[tuple(slice(size) for size in volume.shape)])
+
+
+def extract_mesh_with_marching_cubes(volume, level, step_size=1, mask=None):
+    """
+    Extract mesh from a volume using marching cubes algorithm.
+    
+    A volume already on the GPU is extracted with cuCIM, on its own CUDA
+    stream so concurrent thresholds overlap, and the mesh is copied back to
+    host memory for logging.
+    
+    Args:
+        volume (np.ndarray or cupy.ndarray): Contiguous float32 3D volume data
+        level (float): Intensity level of the extracted surface
+        step_size (int): Voxel step; values above 1 produce a coarser mesh faster
+        mask (np.ndarray, optional): Cells to search, from build_surface_mask;
+            only used on the CPU
         
     Returns:
         tuple: (vertices, faces, normals, values) or None if extraction fails
     """
     try:
+        if cupy is not None and isinstance(volume, cupy.ndarray):
+            with cupy.cuda.Stream(non_blocking=True) as stream:
+                mesh_data = cucim_measure.marching_cubes(
+                    volume,
+                    level=level,
+                    step_size=step_size
+                )
+                mesh_data = tuple(cupy.asnumpy(array, stream=stream) for array in mesh_data)
+                stream.synchronize()
+            return mesh_data
+        
         return measure.marching_cubes(
-            volume_normalized, 
-            level=threshold,
-            spacing=(1.0, 1.0, 1.0)
+            volume,
+            level=level,
+            step_size=step_size,
+            mask=mask
         )
     except Exception as e:
-        logger = setup_logging()
-        logger.error(f"Error in marching cubes at threshold {threshold:.1f}: {str(e)}")
+        logger.error("Error in marching cubes at level %.1f: %s", level, e)
         return None
 
 
-def log_mesh_to_rerun(mesh_path, vertices, faces, normals, color, threshold, metadata_info):
+def log_mesh_to_rerun(mesh_path, vertices, faces, normals, color, threshold, threshold_index, metadata_info):
     """
     Log a mesh and its metadata to Rerun.
     
@@ -390,12 +1387,11 @@ def log_mesh_to_rerun(mesh_path, vertices, faces, normals, color, threshold, met
         vertices (np.ndarray): Mesh vertices
         faces (np.ndarray): Mesh faces
         normals (np.ndarray): Mesh normals
-        color (list): Mesh color
+        color (np.ndarray): uint8 RGBA row, broadcast by Rerun to all vertices
         threshold (float): Threshold level
+        threshold_index (int): Index of the threshold in the mesh configuration
         metadata_info (dict): DICOM metadata
     """
-    logger = setup_logging()
-    
     # Log the mesh
     rr.log(
         mesh_path,
@@ -408,32 +1404,153 @@ def log_mesh_to_rerun(mesh_path, vertices, faces, normals, color, threshold, met
     )
     
     # Create and log metadata
-    tissue_type = get_tissue_type_name(0 if threshold == 0.3 else 1 if threshold == 0.5 else 2)
+    tissue_type = get_tissue_type_name(threshold_index)
     mesh_metadata = create_mesh_metadata_text(
         threshold, len(vertices), len(faces), tissue_type, metadata_info
     )
     rr.log(f"{mesh_path}/info", rr.TextDocument(mesh_metadata))
     
-    logger.info(f"Created mesh at threshold {threshold:.1f}: {len(vertices)} vertices, {len(faces)} faces")
+    logger.info("Created mesh at threshold %.1f: %d vertices, %d faces", threshold, len(vertices), len(faces))
+
+
+def write_scratch_array(array, scratch_dir, name, dtype=None):
+    """
+    Write an array to a .npy file in a scratch directory.
+    
+    Args:
+        array (np.ndarray): Array to write
+        scratch_dir (str): Directory to write the file in
+        name (str): File name without extension
+        dtype (np.dtype, optional): Type to store the array as
+        
+    Returns:
+        str: Path of the written file
+    """
+    file_path = os.path.join(scratch_dir, f"{name}.npy")
+    scratch_array = np.lib.format.open_memmap(
+        file_path, mode='w+', dtype=dtype or array.dtype, shape=array.shape
+    )
+    scratch_array[:] = array
+    scratch_array.flush()
+    del scratch_array
+    return file_path
 
 
-def create_mesh_from_volume(volume_3d, entity_path, metadata_info):
+def extract_mesh_from_scratch_files(volume_path, level, step_size=1, mask_path=None):
+    """
+    Extract a mesh from a volume and mask written with write_scratch_array.
+    
+    The files are mapped copy-on-write, so every worker process reads the
+    same pages instead of receiving its own pickled copy of the arrays.
+    
+    Args:
+        volume_path (str): Path of the float32 volume file
+        level (float): Intensity level of the extracted surface
+        step_size (int): Voxel step; values above 1 produce a coarser mesh faster
+        mask_path (str, optional): Path of the surface mask file
+        
+    Returns:
+        tuple: (vertices, faces, normals, values) or None if extraction fails
+    """
+    volume = np.load(volume_path, mmap_mode='c')
+    mask = np.load(mask_path, mmap_mode='c') if mask_path is not None else None
+    return extract_mesh_with_marching_cubes(volume, level, step_size, mask)
+
+
+def create_mesh_from_volume(volume_3d, entity_path, metadata_info, value_range=None, executor=None):
     """
     Create 3D mesh from volume data using marching cubes algorithm.
     
+    Marching cubes runs for all thresholds in parallel. scikit-image holds
+    the GIL for most of the extraction, so the run's worker pool is used
+    when one is given; without it, or on the GPU path, a local thread pool
+    runs them. Worker processes map the volume and mask from scratch files
+    rather than each task pickling them. Logging to Rerun stays on the
+    calling thread.
+    
     Args:
         volume_3d (np.ndarray): 3D volume data
         entity_path (str): Rerun entity path for the mesh
         metadata_info (dict): DICOM metadata for the series
+        value_range (tuple, optional): (min, max) of the volume if already known
+        executor (concurrent.futures.Executor, optional): Pool to run marching
+            cubes in
     """
-    logger = setup_logging()
-    
     try:
-        volume_normalized = normalize_volume(volume_3d)
-        thresholds, colors = get_mesh_configuration()
+        # The thresholds are fractions of the intensity range, so they are
+        # mapped to raw levels instead of normalizing the whole volume
+        min_value, max_value = value_range or compute_value_range(volume_3d)
+        value_span = max_value - min_value
+        
+        if value_span < 1e-6:
+            logger.warning("Flat volume at %s, skipping mesh creation", entity_path)
+            return
+        
+        thresholds, colors, step_size = get_mesh_configuration()
+        step_size = get_marching_cubes_step_size(volume_3d.shape, step_size)
+        levels = [min_value + threshold * value_span for threshold in thresholds]
+        use_gpu_mesh = (
+            cupy is not None
+            and cucim_measure is not None
+            and volume_3d.size > GPU_MESH_MIN_VOXELS
+        )
+        use_scratch_files = not use_gpu_mesh and isinstance(executor, ProcessPoolExecutor)
+        
+        # The thresholds are independent, so extract them concurrently; the
+        # results are logged from this thread, in threshold order. Device
+        # arrays cannot be sent to other processes, so the GPU path uses threads.
+        if executor is None or use_gpu_mesh:
+            mesh_pool = ThreadPoolExecutor(max_workers=len(levels))
+        else:
+            mesh_pool = nullcontext(executor)
+        
+        scratch_context = (
+            tempfile.TemporaryDirectory(ignore_cleanup_errors=True) if use_scratch_files else nullcontext()
+        )
+        with scratch_context as scratch_dir, mesh_pool as mesh_executor:
+            # Marching cubes works on contiguous float32; convert once here
+            # rather than letting every threshold make its own copy
+            if use_scratch_files:
+                volume_path = write_scratch_array(volume_3d, scratch_dir, 'volume', np.float32)
+                volume_float32 = np.load(volume_path, mmap_mode='c')
+            else:
+                volume_float32 = np.ascontiguousarray(volume_3d, dtype=np.float32)
+            
+            surface_mask = None
+            if use_gpu_mesh:
+                # Upload once; every threshold reads the same device volume.
+                # The meshing runs on non-blocking streams that do not wait for
+                # the default stream, so the copy must finish first. This path
+                # needs a CUDA device and is not covered by the tests.
+                volume_float32 = cupy.asarray(volume_float32)
+                cupy.cuda.get_current_stream().synchronize()
+            elif MESH_OVERVIEW_STEP is not None and step_size < MESH_OVERVIEW_STEP:
+                surface_mask = build_surface_mask(volume_float32, levels, MESH_OVERVIEW_STEP)
+            
+            if use_scratch_files:
+                mask_path = None
+                if surface_mask is not None:
+                    mask_path = write_scratch_array(surface_mask, scratch_dir, 'mask')
+                mesh_futures = [
+                    mesh_executor.submit(
+                        extract_mesh_from_scratch_files, volume_path, level, step_size, mask_path
+                    )
+                    for level in levels
+                ]
+            else:
+                mesh_futures = [
+                    mesh_executor.submit(
+                        extract_mesh_with_marching_cubes, volume_float32, level, step_size, surface_mask
+                    )
+                    for level in levels
+                ]
+            
+            # The scratch files must outlive the tasks that map them
+            mesh_results = [mesh_future.result() for mesh_future in mesh_futures]
+            del volume_float32, surface_mask
         
         for i, threshold in enumerate(thresholds):
-            mesh_data = extract_mesh_with_marching_cubes(volume_normalized, threshold)
+            mesh_data = mesh_results[i]
             
             if mesh_data is None:
                 continue
@@ -442,32 +1559,12 @@ def create_mesh_from_volume(volume_3d, entity_path, metadata_info):
             
             if len(verts) > 0 and len(faces) > 0:
                 mesh_path = f"{entity_path}/threshold_{threshold:.1f}"
-                log_mesh_to_rerun(mesh_path, verts, faces, normals, colors[i], threshold, metadata_info)
+                log_mesh_to_rerun(mesh_path, verts, faces, normals, colors[i], threshold, i, metadata_info)
             else:
-                logger.warning(f"No mesh generated at threshold {threshold:.1f}")
+                logger.warning("No mesh generated at threshold %.1f", threshold)
                 
     except Exception as e:
-        logger.error(f"Error in mesh creation: {str(e)}")
-
-
-def group_files_by_series(dicom_files):
-    """
-    Group DICOM files by their series UID.
-    
-    Args:
-        dicom_files (list): List of DICOM file dictionaries
-        
-    Returns:
-        dict: Dictionary with series UID as keys and file lists as values
-    """
-    series_groups = {}
-    for file_info in dicom_files:
-        series_uid = file_info['series_uid']
-        if series_uid not in series_groups:
-            series_groups[series_uid] = []
-        series_groups[series_uid].append(file_info)
-    
-    return series_groups
+        logger.error("Error in mesh creation: %s", e)
 
 
 def validate_series_for_3d_volume(series_files, series_uid):
@@ -481,30 +1578,87 @@ def validate_series_for_3d_volume(series_files, series_uid):
     Returns:
         bool: True if valid for 3D volume creation
     """
-    logger = setup_logging()
-    
     if len(series_files) < 2:
-        logger.warning(f"Series {series_uid} has only {len(series_files)} images, skipping 3D volume creation")
+        logger.warning("Series %s has only %d images, skipping 3D volume creation", series_uid, len(series_files))
         return False
     
     return True
 
 
-def stack_pixel_arrays(series_files):
+def stack_pixel_arrays(series_files, scratch_file=None):
     """
     Stack pixel arrays from series files to create a 3D volume.
     
+    The volume is allocated once and each slice is copied straight into it,
+    avoiding the intermediate list and per-array overhead of np.stack. Each
+    2D array is released from its file dictionary as soon as it is copied.
+    
     Args:
         series_files (list): List of DICOM file dictionaries
+        scratch_file (file, optional): Open binary file to back the volume with
+            a memory map, letting the OS page it out instead of holding it in RAM
         
     Returns:
         np.ndarray: 3D volume array
     """
-    pixel_arrays = [file_info['pixel_array'] for file_info in series_files]
-    return np.stack(pixel_arrays, axis=0)
+    first_slice = series_files[0]['pixel_array']
+    shape = (len(series_files),) + first_slice.shape
+    
+    if scratch_file is not None:
+        volume_3d = np.memmap(scratch_file, dtype=first_slice.dtype, mode='w+', shape=shape)
+    else:
+        volume_3d = np.empty(shape, dtype=first_slice.dtype)
+    
+    for index, file_info in enumerate(series_files):
+        volume_3d[index] = file_info.pop('pixel_array')
+    
+    assert volume_3d.flags['C_CONTIGUOUS']
+    return volume_3d
+
+
+def combine_slice_statistics(series_files):
+    """
+    Combine the per-slice statistics gathered while logging images into
+    statistics of the whole volume, without another pass over its voxels.
+    
+    Args:
+        series_files (list): List of DICOM files in the series
+        
+    Returns:
+        tuple or None: (min, max, mean) of the volume, or None if a slice has
+            no statistics
+    """
+    if any('pixel_statistics' not in file_info for file_info in series_files):
+        return None
+    
+    # Slices of a volume share one shape, so the mean of means is exact
+    min_values, max_values, mean_values = zip(*(file_info['pixel_statistics'] for file_info in series_files))
+    return float(min(min_values)), float(max(max_values)), float(np.mean(mean_values))
 
 
-def log_volume_to_rerun(volume_3d, series_uid, series_files):
+def volume_to_uint8_windowed(volume_3d, low, high):
+    """
+    Quantize a volume to uint8 over a window for the Rerun tensor view.
+    
+    Slices are converted one at a time so the float temporaries stay slice
+    sized.
+    
+    Args:
+        volume_3d (np.ndarray): 3D volume data
+        low (float): Value mapped to 0
+        high (float): Value mapped to 255
+        
+    Returns:
+        np.ndarray: uint8 volume
+    """
+    volume_uint8 = np.empty(volume_3d.shape, dtype=np.uint8)
+    for index in range(volume_3d.shape[0]):
+        volume_uint8[index] = window_to_uint8(volume_3d[index], low, high)
+    
+    return volume_uint8
+
+
+def log_volume_to_rerun(volume_3d, series_uid, series_files, executor=None):
     """
     Log a 3D volume, its mesh, and metadata to Rerun.
     
@@ -512,96 +1666,134 @@ def log_volume_to_rerun(volume_3d, series_uid, series_files):
         volume_3d (np.ndarray): 3D volume data
         series_uid (str): Series UID
         series_files (list): List of DICOM files in the series
+        executor (concurrent.futures.Executor, optional): Pool to extract meshes in
     """
-    logger = setup_logging()
-    
-    # Log 3D tensor volume
+    # The slice statistics from image logging give the volume's statistics
+    # for free; otherwise one fused reduction computes them. They feed the
+    # tensor window, the mesh levels and the volume metadata.
+    volume_statistics = combine_slice_statistics(series_files)
+    if volume_statistics is None:
+        volume_statistics = compute_pixel_statistics(volume_3d)
+    min_value, max_value, mean_value = (float(value) for value in volume_statistics)
+    value_range = (min_value, max_value)
+    
+    # Log 3D tensor volume, quantized to 8 bits over its full value range; the
+    # window used is logged alongside so the stored values can be mapped back
     tensor_entity_path = f"tensor/{series_uid}"
-    rr.log(tensor_entity_path, rr.Tensor(volume_3d))
+    volume_uint8 = volume_to_uint8_windowed(volume_3d, min_value, max_value)
+    rr.log(tensor_entity_path, rr.Tensor(volume_uint8))
+    rr.log(
+        f"{tensor_entity_path}/info",
+        rr.TextDocument(VOLUME_METADATA_TEMPLATE.format(
+            min_value=min_value,
+            max_value=max_value,
+            mean_value=mean_value,
+            window_low=min_value,
+            window_high=max_value
+        ))
+    )
+    del volume_uint8
     
     # Create 3D mesh
-    mesh_entity_path = f"mesh/{series_uid}"
-    create_mesh_from_volume(volume_3d, mesh_entity_path, series_files[0])
-    
-    logger.info(f"Created 3D volume for series {series_uid}")
-    logger.info(f"  Volume shape: {volume_3d.shape}")
-    logger.info(f"  Number of slices: {len(series_files)}")
+    if len(series_files) >= MIN_SLICES_FOR_MESH:
+        mesh_entity_path = f"mesh/{series_uid}"
+        create_mesh_from_volume(volume_3d, mesh_entity_path, series_files[0], value_range, executor)
+    else:
+        logger.info("Series %s has only %d slices, skipping mesh creation", series_uid, len(series_files))
+    
+    logger.info("Created 3D volume for series %s", series_uid)
+    logger.info("  Volume shape: %s", volume_3d.shape)
+    logger.info("  Number of slices: %d", len(series_files))
 
 
-def process_single_series_for_3d_volume(series_uid, series_files):
+def process_single_series_for_3d_volume(series_uid, series_files, executor=None):
     """
     Process a single series to create a 3D volume.
     
     Args:
         series_uid (str): Series UID
         series_files (list): List of DICOM files in the series
+        executor (concurrent.futures.Executor, optional): Pool to extract meshes in
     """
-    logger = setup_logging()
-    
     if not validate_series_for_3d_volume(series_files, series_uid):
         return
     
-    logger.info(f"Creating 3D volume for series {series_uid} with {len(series_files)} slices")
+    logger.info("Creating 3D volume for series %s with %d slices", series_uid, len(series_files))
     
     try:
-        volume_3d = stack_pixel_arrays(series_files)
-        log_volume_to_rerun(volume_3d, series_uid, series_files)
+        with tempfile.TemporaryFile() as scratch_file:
+            volume_3d = stack_pixel_arrays(series_files, scratch_file)
+            log_volume_to_rerun(volume_3d, series_uid, series_files, executor)
         
     except Exception as e:
-        logger.error(f"Error creating 3D volume for series {series_uid}: {str(e)}")
+        logger.error("Error creating 3D volume for series %s: %s", series_uid, e)
 
 
-def create_3d_volumes(dicom_files):
+def process_series(series_uid, series_files, executor, use_threads=False):
     """
-    Create 3D volumes by stacking sorted DICOM instances and log to Rerun.
+    Load one series' pixel data, log its images and create its 3D volume.
+    
+    The pixel arrays are released once the series is done, so only one
+    series is held in memory at a time.
     
     Args:
-        dicom_files (list): Sorted list of DICOM file metadata
+        series_uid (str): Series UID
+        series_files (list): Sorted list of DICOM files in the series
+        executor (concurrent.futures.Executor): Pool to read the files and extract meshes with
+        use_threads (bool): Whether executor is a thread pool
     """
-    logger = setup_logging()
-    logger.info("Creating 3D volumes from sorted DICOM instances")
+    series_files = load_series_pixel_arrays(series_files, executor, use_threads)
     
-    series_groups = group_files_by_series(dicom_files)
+    if not series_files:
+        logger.warning("Series %s has no images with pixel data", series_uid)
+        return
     
-    for series_uid, series_files in series_groups.items():
-        process_single_series_for_3d_volume(series_uid, series_files)
-
+    try:
+        log_series_images(series_uid, series_files)
+        logger.info("Logged %d images for series %s", len(series_files), series_uid)
+        
+        process_single_series_for_3d_volume(series_uid, series_files, executor)
+    finally:
+        for file_info in series_files:
+            file_info.pop('pixel_array', None)
+            file_info.pop('pixel_statistics', None)
 
 
 def initialize_rerun_with_blueprint():
     """
     Initialize Rerun viewer with a custom blueprint.
     """
-    blueprint = create_blueprint()
-    rr.init("dicom_viewer_1.0.3", spawn=True, default_blueprint=blueprint)
+    rr.init("dicom_viewer_1.0.3", spawn=True, default_blueprint=BLUEPRINT)
 
 
 
-def process_dicom_folder(folder_path):
+def process_dicom_folder(folder_path, use_threads=False):
     """
     Main processing function that loads DICOM files and creates both individual series and 3D volumes.
     
     Args:
         folder_path (str): Path to the folder containing DICOM files
+        use_threads (bool): Read files with threads instead of processes
     """
-    logger = setup_logging()
-    
     initialize_rerun_with_blueprint()
-    dicom_files = load_and_sort_dicom_files(folder_path)
     
-    if not dicom_files:
-        logger.error("No valid DICOM files found")
-        return
-    
-    # Log individual series
-    log_individual_series(dicom_files)
-    
-    # Create 3D volumes
-    create_3d_volumes(dicom_files)
+    with create_worker_pool(use_threads) as executor:
+        dicom_files = load_and_sort_dicom_files(folder_path, executor)
+        
+        if not dicom_files:
+            logger.error("No valid DICOM files found")
+            return
+        
+        logger.info("Logging series and creating 3D volumes")
+        
+        # Files are sorted by series UID, so each series is one contiguous run
+        for series_uid, group in groupby(dicom_files, key=itemgetter('series_uid')):
+            series_files = list(group)
+            process_series(series_uid, series_files, executor, use_threads)
 
 
 def main():
-    logger = setup_logging()
+    setup_logging()
     
     dicom_folder = input("Enter the path to the DICOM folder: ").strip()
     
@@ -609,9 +1801,13 @@ def main():
         logger.error("No folder path provided")
         return
     
-    logger.info(f"Starting DICOM analysis with Rerun for folder: {dicom_folder}")
+    # Threads suit network storage, where reading the files dominates
+    answer = input("Read files with threads, e.g. for network storage? [y/N]: ")
+    use_threads = answer.strip().lower() in ('y', 'yes')
+    
+    logger.info("Starting DICOM analysis with Rerun for folder: %s", dicom_folder)
     
-    process_dicom_folder(dicom_folder)
+    process_dicom_folder(dicom_folder, use_threads)
     
     logger.info("DICOM analysis complete. Rerun viewer should be open with visualizations.")
     
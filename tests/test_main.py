@@ -0,0 +1,250 @@
+import logging
+import os
+
+import numpy as np
+import pydicom
+import pytest
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, ImplicitVRLittleEndian, generate_uid
+from skimage import measure
+
+from dicom_rerun.main import (
+    INSTANCE_NUMBER_TAG,
+    RESCALE_INTERCEPT_TAG,
+    RESCALE_SLOPE_TAG,
+    WINDOW_CENTER_TAG,
+    WINDOW_WIDTH_TAG,
+    build_surface_mask,
+    compute_pixel_statistics,
+    compute_value_range,
+    create_worker_pool,
+    extract_mesh_from_scratch_files,
+    iter_files,
+    load_pixel_array,
+    map_uncompressed_pixel_array,
+    read_file_bytes,
+    read_dicom_metadata,
+    write_scratch_array,
+)
+
+
+def write_dicom_file(path, raw_values):
+    """
+    Write a minimal DICOM file with the given raw element strings.
+
+    The file uses implicit VR, so the elements are stored as LO to bypass
+    write-time IS/DS validation and are read back as IS/DS from the dictionary.
+
+    Args:
+        path (Path): Output file path
+        raw_values (dict): Tag number to raw string value
+
+    Returns:
+        str: Path of the written file
+    """
+    dataset = Dataset()
+    dataset.file_meta = FileMetaDataset()
+    dataset.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+    dataset.file_meta.MediaStorageSOPClassUID = '1.2.840.10008.5.1.4.1.1.2'
+    dataset.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    dataset.SeriesInstanceUID = generate_uid()
+    dataset.Modality = 'CT'
+
+    for tag, value in raw_values.items():
+        dataset.add_new(tag, 'LO', value)
+
+    dataset.save_as(path, write_like_original=False)
+    return str(path)
+
+
+def write_image_file(path, pixel_array, transfer_syntax, bits_stored):
+    """
+    Write a single-frame monochrome DICOM image with uncompressed pixel data.
+
+    Args:
+        path (Path): Output file path
+        pixel_array (np.ndarray): 2D little endian array of 8, 16 or 32 bit integers
+        transfer_syntax (str): ExplicitVRLittleEndian or ImplicitVRLittleEndian
+        bits_stored (int): BitsStored of the image
+
+    Returns:
+        str: Path of the written file
+    """
+    dataset = Dataset()
+    dataset.file_meta = FileMetaDataset()
+    dataset.file_meta.TransferSyntaxUID = transfer_syntax
+    dataset.file_meta.MediaStorageSOPClassUID = '1.2.840.10008.5.1.4.1.1.2'
+    dataset.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    dataset.SOPClassUID = dataset.file_meta.MediaStorageSOPClassUID
+    dataset.SamplesPerPixel = 1
+    dataset.PhotometricInterpretation = 'MONOCHROME2'
+    dataset.Rows, dataset.Columns = pixel_array.shape
+    dataset.BitsAllocated = pixel_array.dtype.itemsize * 8
+    dataset.BitsStored = bits_stored
+    dataset.HighBit = bits_stored - 1
+    dataset.PixelRepresentation = int(pixel_array.dtype.kind == 'i')
+    dataset.PixelData = pixel_array.tobytes()
+
+    dataset.save_as(path, write_like_original=False)
+    return str(path)
+
+
+@pytest.mark.parametrize('raw_value, expected', [
+    ('7', 7),
+    ('1.0', 1),
+    ('1e3', 1000),
+    (' 12 ', 12),
+])
+def test_instance_number_accepts_pydicom_integer_forms(tmp_path, raw_value, expected):
+    file_path = write_dicom_file(tmp_path / 'image.dcm', {INSTANCE_NUMBER_TAG: raw_value})
+
+    metadata = read_dicom_metadata(file_path)
+
+    assert metadata is not None
+    assert metadata['instance_number'] == expected
+
+
+@pytest.mark.parametrize('raw_value', ['abc', '12abc'])
+def test_invalid_instance_number_skips_file(tmp_path, raw_value):
+    file_path = write_dicom_file(tmp_path / 'image.dcm', {INSTANCE_NUMBER_TAG: raw_value})
+
+    assert read_dicom_metadata(file_path) is None
+
+
+def test_numeric_display_tags_are_parsed(tmp_path):
+    file_path = write_dicom_file(tmp_path / 'image.dcm', {
+        INSTANCE_NUMBER_TAG: '1',
+        WINDOW_CENTER_TAG: '40\\50',
+        WINDOW_WIDTH_TAG: '4e2',
+        RESCALE_SLOPE_TAG: '1.5',
+        RESCALE_INTERCEPT_TAG: '-1024',
+    })
+
+    metadata = read_dicom_metadata(file_path)
+
+    assert metadata['window_center'] == 40.0
+    assert metadata['window_width'] == 400.0
+    assert metadata['rescale_slope'] == 1.5
+    assert metadata['rescale_intercept'] == -1024.0
+
+
+@pytest.mark.parametrize('tag, key, default', [
+    (WINDOW_CENTER_TAG, 'window_center', None),
+    (WINDOW_WIDTH_TAG, 'window_width', None),
+    (RESCALE_SLOPE_TAG, 'rescale_slope', 1.0),
+    (RESCALE_INTERCEPT_TAG, 'rescale_intercept', 0.0),
+])
+def test_invalid_display_tag_falls_back_to_default(tmp_path, tag, key, default):
+    file_path = write_dicom_file(tmp_path / 'image.dcm', {INSTANCE_NUMBER_TAG: '3', tag: '40abc'})
+
+    metadata = read_dicom_metadata(file_path)
+
+    assert metadata is not None
+    assert metadata['instance_number'] == 3
+    assert metadata[key] == default
+
+
+@pytest.mark.parametrize('axis', [0, 1, 2])
+def test_surface_mask_keeps_structures_past_last_coarse_sample(axis):
+    shape = [40, 40, 40]
+    shape[axis] = 11
+    block = [slice(10, 18)] * 3
+    block[axis] = slice(9, 11)
+    volume = np.zeros(shape, dtype=np.float32)
+    volume[tuple(block)] = 1.0
+    volume[2:6, 2:6, 2:6] = 1.0
+
+    mask = build_surface_mask(volume, [0.5], overview_step=4)
+
+    full_vertices = measure.marching_cubes(volume, level=0.5)[0]
+    masked_vertices = measure.marching_cubes(volume, level=0.5, mask=mask)[0]
+    assert len(masked_vertices) == len(full_vertices)
+
+
+def test_iter_files_skips_unreadable_directories(tmp_path, monkeypatch):
+    (tmp_path / 'readable').mkdir()
+    (tmp_path / 'readable' / 'a.dcm').write_bytes(b'')
+    (tmp_path / 'locked').mkdir()
+    (tmp_path / 'locked' / 'b.dcm').write_bytes(b'')
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == 'locked':
+            raise PermissionError(13, 'Permission denied', path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', scandir)
+
+    assert list(iter_files(tmp_path)) == [str(tmp_path / 'readable' / 'a.dcm')]
+
+
+def test_worker_process_logs_reach_parent_handlers(tmp_path, caplog):
+    missing_file = str(tmp_path / 'missing.dcm')
+
+    with caplog.at_level(logging.ERROR):
+        with create_worker_pool() as executor:
+            assert executor.submit(load_pixel_array, missing_file).result() is None
+
+    assert any(missing_file in record.getMessage() for record in caplog.records)
+
+
+def test_mesh_from_scratch_files_matches_in_memory_volume(tmp_path):
+    volume = np.zeros((12, 12, 12), dtype=np.int16)
+    volume[3:9, 3:9, 3:9] = 100
+    mask = build_surface_mask(volume.astype(np.float32), [50.0], overview_step=4)
+
+    volume_path = write_scratch_array(volume, str(tmp_path), 'volume', np.float32)
+    mask_path = write_scratch_array(mask, str(tmp_path), 'mask')
+    with create_worker_pool() as executor:
+        mesh_data = executor.submit(extract_mesh_from_scratch_files, volume_path, 50.0, 1, mask_path).result()
+
+    expected = measure.marching_cubes(volume.astype(np.float32), level=50.0)
+    assert np.array_equal(mesh_data[0], expected[0])
+    assert np.array_equal(mesh_data[1], expected[1])
+
+
+@pytest.mark.parametrize('dtype', [np.bool_, np.uint8, np.int16, np.uint16, np.int32, np.uint32, np.float32])
+def test_pixel_statistics_match_numpy(dtype):
+    pixel_array = (np.arange(-300, 300, dtype=np.float64).reshape(20, 30) * 7.5).astype(dtype)
+
+    min_value, max_value, mean_value = compute_pixel_statistics(pixel_array)
+
+    assert min_value == pixel_array.min()
+    assert max_value == pixel_array.max()
+    assert mean_value == pytest.approx(pixel_array.mean(dtype=np.float64))
+    assert compute_value_range(pixel_array) == (float(pixel_array.min()), float(pixel_array.max()))
+
+
+@pytest.mark.parametrize('transfer_syntax', [ExplicitVRLittleEndian, ImplicitVRLittleEndian])
+@pytest.mark.parametrize('pixel_array, bits_stored', [
+    (np.arange(12, dtype='<u2').reshape(3, 4) * 5000, 16),
+    (np.arange(-6, 6, dtype='<i2').reshape(3, 4) * 300, 12),
+    (np.arange(12, dtype='u1').reshape(3, 4) * 20, 8),
+    (np.arange(-6, 6, dtype='<i4').reshape(3, 4) * 100000, 32),
+])
+def test_mapped_pixel_array_matches_pydicom(tmp_path, transfer_syntax, pixel_array, bits_stored):
+    file_path = write_image_file(tmp_path / 'image.dcm', pixel_array, transfer_syntax, bits_stored)
+    expected = pydicom.dcmread(file_path).pixel_array
+
+    assert map_uncompressed_pixel_array(file_path) is not None
+    for raw_bytes in (None, read_file_bytes(file_path)):
+        loaded = load_pixel_array(file_path, raw_bytes)
+        assert loaded.dtype == expected.dtype
+        assert np.array_equal(loaded, expected)
+
+
+@pytest.mark.parametrize('transfer_syntax', [ExplicitVRLittleEndian, ImplicitVRLittleEndian])
+@pytest.mark.parametrize('dtype', ['<i2', '<u2'])
+def test_mapped_pixel_array_ignores_bits_above_bits_stored(tmp_path, transfer_syntax, dtype):
+    stored = np.array([[0x0FFF, 0xF800, 0x07FF, 0x1234], [0x0000, 0x8001, 0xFFFF, 0x0800]], dtype='<u2')
+    file_path = write_image_file(tmp_path / 'image.dcm', stored.view(dtype), transfer_syntax, 12)
+
+    # Only the low 12 bits carry the value; signed values extend bit 11
+    expected = stored.astype(np.int64) & 0x0FFF
+    if dtype == '<i2':
+        expected = (expected ^ 0x0800) - 0x0800
+
+    for raw_bytes in (None, read_file_bytes(file_path)):
+        loaded = load_pixel_array(file_path, raw_bytes)
+        assert loaded.dtype == np.dtype(dtype)
+        assert np.array_equal(loaded, expected)